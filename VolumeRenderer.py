@@ -1,33 +1,83 @@
-import sys
-from PyQt5.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QFileDialog, QWidget, QMessageBox
 from PyQt5.QtCore import QTimer
-from PyQt5.uic import loadUi
-import vtk
-import os
-from vtk.qt.QVTKRenderWindowInteractor import QVTKRenderWindowInteractor
-import numpy as np
+# import only the VTK kits in use instead of the monolithic vtk package
+from vtkmodules.vtkCommonDataModel import vtkImageData, vtkPiecewiseFunction
+from vtkmodules.vtkFiltersCore import vtkFlyingEdges3D
+from vtkmodules.vtkImagingCore import vtkImageResample, vtkImageShiftScale
+from vtkmodules.vtkImagingGeneral import vtkImageGaussianSmooth
+from vtkmodules.vtkRenderingAnnotation import vtkCubeAxesActor2D
+from vtkmodules.vtkRenderingCore import (vtkActor, vtkColorTransferFunction, vtkLight, vtkPolyDataMapper,
+                                         vtkRenderer, vtkTextProperty, vtkVolume, vtkVolumeProperty)
+from vtkmodules.vtkRenderingVolume import vtkGPUVolumeRayCastMapper
+# rendering backends, needed for the object factory overrides of the classes above
+import vtkmodules.vtkRenderingFreeType
+import vtkmodules.vtkRenderingOpenGL2
+import vtkmodules.vtkRenderingVolumeOpenGL2
+from vtkmodules.util import numpy_support
+
+try:
+    from scipy.ndimage import gaussian_filter
+except ImportError:  # fall back to vtkImageGaussianSmooth
+    gaussian_filter = None
 
 
 class VolumeRenderer:
+    # ray casting transfer function control points, in raw volume intensities
+    COLOR_POINTS = ((0, (0.0, 0.0, 0.0)), (200, (1.0, 1.0, 1.0)))
+    # fully opaque from 180 on, so early ray termination stops rays sooner
+    OPACITY_POINTS = ((0, 0.0), (80, 0.1), (120, 0.8), (180, 1.0))
+
     def __init__(self, vtk_widget, main_window):
         self.vtk_widget = vtk_widget
         self.main_window = main_window
         self.volume = None  # the VTK DICOM image reader
         self.iso_value = 0
-        # all the intensity values to be used in visualization
-        self.intensity_values = list()
+        # scalar range (inclusive) of the loaded volume used in visualization
+        self.scalar_min = 0
+        self.scalar_max = 0
         # means nothing is visualized (used for reimporting)
         self.visualize_flag = 0
+        # cached gaussian-smoothed copy of the volume and the source mtime it was built from
+        self._smoothed = None
+        self._smoothed_src_mtime = None
+        # cached half-resolution copy of the smoothed volume used while dragging the slider
+        self._low_res = None
+        self._low_res_src = None
+        # cached 8-bit copy of the volume fed to the ray-cast mapper
+        self._quantized = None
+        self._quantized_src = None
+        # VTK pipeline objects, built lazily on first use and reused across re-renders
+        self._contour = None
+        self._surf_mapper = None
+        self._surf_actor = None
+        self._ray_mapper = None
+        self._ray_actor = None
+        # volume output and rendering mode currently shown in the render window
+        self._rendered_volume = None
+        self._rendered_mode = None
+        # fit the camera to the scene on the next full render (set when a new volume is loaded)
+        self._needs_reset = False
+
+        # single-shot timer used to coalesce a burst of slider ticks into one re-render
+        self._iso_timer = QTimer(singleShot=True)
+        self._iso_timer.timeout.connect(self.update_visualization)
 
         self.main_window.ui.IsoValueSlider.valueChanged.connect(
             self.handle_iso_value)
+        self.main_window.ui.IsoValueSlider.sliderReleased.connect(
+            self.handle_slider_released)
 
-        self.renderer = vtk.vtkRenderer()
+        self.renderer = vtkRenderer()
         self.render_window = vtk_widget.GetRenderWindow()
         self.render_window.AddRenderer(self.renderer)
 
+        # frame-rate hints for the ray-cast mapper (AutoAdjustSampleDistances is on by default):
+        # coarser sampling while the camera is being moved, full quality once it stops
+        interactor = self.render_window.GetInteractor()
+        interactor.SetDesiredUpdateRate(15.0)
+        interactor.SetStillUpdateRate(0.001)
+
         # head light setup
-        headlight = vtk.vtkLight()
+        headlight = vtkLight()
         headlight.SetLightTypeToHeadlight()
         self.renderer.AddLight(headlight)
 
@@ -36,35 +86,185 @@ class VolumeRenderer:
         self.camera.SetPosition(0, 0, 300)
         self.camera.SetFocalPoint(0, 0, 0)
 
+        # reference axes, built once and only re-bounded on each render
+        self._cube_axes = self.create_reference_axes()
+
+        # ray casting transfer functions and volume property, populated once and shared by every render
+        self._vol_prop = self.create_volume_property()
+        self._ctf = self._vol_prop.GetRGBTransferFunction()
+        self._otf = self._vol_prop.GetScalarOpacity()
+        self.populate_transfer_functions(0, 255)
+
+    def reset(self):
+        """
+        Clear the current visualization in place.
+
+        Removes every actor from the renderer, forgets the loaded volume and its cached
+        copies, detaches the pipelines from it and moves the camera back to its initial
+        position. The renderer, the pipeline objects and the slider connections are kept
+        for the next volume.
+        """
+        self._iso_timer.stop()
+        self.renderer.RemoveAllViewProps()
+        self.volume = None
+        self.visualize_flag = 0
+        self.scalar_min = 0
+        self.scalar_max = 0
+        self.invalidate_smoothing_cache()
+        self._rendered_volume = None
+        self._rendered_mode = None
+
+        # detach the pipelines from the old volume so its memory is released now
+        if self._contour is not None:
+            self._contour.RemoveAllInputs()
+            self._contour.GetOutput().Initialize()  # the extracted surface
+        if self._ray_mapper is not None:
+            self._ray_mapper.RemoveAllInputs()
+
+        self.camera.SetPosition(0, 0, 300)
+        self.camera.SetFocalPoint(0, 0, 0)
+
+    def load_volume(self, dicom_reader):
+        """
+        Set a newly loaded DICOM series as the volume to be rendered.
+
+        Drops the caches derived from the previous volume, computes the iso-value range
+        of the new one and makes the next render fit the camera to it.
+
+        Parameters:
+            dicom_reader (vtkDICOMImageReader): The reader holding the loaded series.
+        """
+        self.volume = dicom_reader
+        # the smoothed copy belongs to the previous volume
+        self.invalidate_smoothing_cache()
+        self._needs_reset = True
+        # compute all the possible iso-values that exists in the render
+        self.compute_intensity_values()
+        # move the transfer function points into the window the ray-cast input is quantized with
+        self.populate_transfer_functions(
+            *self.volume.GetOutput().GetScalarRange())
+
     def compute_intensity_values(self):
         """
         Compute intensity values from the scalar range of the loaded volume.
 
         This function retrieves the scalar range from the loaded volume using VTK.
-        It then generates a list of integer intensity values covering the entire
-        scalar range, inclusive. The computed intensity values can be used, for example,
-        in setting up sliders for iso-surface extraction thresholds.
+        It then stores the integer bounds of the scalar range, inclusive. The computed
+        bounds can be used, for example, in setting up sliders for iso-surface
+        extraction thresholds.
 
        """
         smoothed_volume = self.apply_gaussian_smoothing(
             self.volume.GetOutput())
         scalar_range = smoothed_volume.GetScalarRange()
-        self.intensity_values = list(
-            range(int(scalar_range[0]), int(scalar_range[1]) + 1))
+        self.scalar_min = int(scalar_range[0])
+        self.scalar_max = int(scalar_range[1])
         self.set_iso_sliders()
 
     def apply_gaussian_smoothing(self, volume):
         """
-            Apply Gaussian smoothing to a 3D volume using VTK.
+            Apply Gaussian smoothing to a 3D VTK volume using SciPy.
 
             This function takes a VTK volume as input, applies Gaussian smoothing using
-            vtkImageGaussianSmooth, and returns the smoothed volume.
+            SciPy's separable gaussian_filter (one 1D pass per axis), and returns the smoothed
+            volume. vtkImageGaussianSmooth is used when SciPy is not installed; the two agree
+            away from the volume edges, but differ in the boundary slices since SciPy pads
+            with the nearest voxel while VTK clips the kernel. The result is cached and
+            reused as long as the input volume has not been modified.
+        """
+        if self._smoothed is not None and volume.GetMTime() == self._smoothed_src_mtime:
+            return self._smoothed
+
+        if gaussian_filter is None:
+            gaussian_smooth = vtkImageGaussianSmooth()
+            gaussian_smooth.SetInputData(volume)
+            gaussian_smooth.SetStandardDeviation(1.0)
+            # same kernel extent (3 sigma) as the SciPy path below (edge handling differs)
+            gaussian_smooth.SetRadiusFactors(3.0, 3.0, 3.0)
+            gaussian_smooth.Update()
+            self._smoothed = gaussian_smooth.GetOutput()
+        else:
+            # VTK stores the voxels x-fastest, i.e. as a (z, y, x) array
+            nx, ny, nz = volume.GetDimensions()
+            voxels = numpy_support.vtk_to_numpy(
+                volume.GetPointData().GetScalars()).reshape(nz, ny, nx)
+            smoothed_voxels = gaussian_filter(
+                voxels, 1.0, mode='nearest', truncate=3.0)
+
+            smoothed_volume = vtkImageData()
+            smoothed_volume.CopyStructure(volume)  # extent, spacing and origin
+            smoothed_volume.GetPointData().SetScalars(
+                numpy_support.numpy_to_vtk(smoothed_voxels.ravel(), deep=True))
+            self._smoothed = smoothed_volume
+        self._smoothed_src_mtime = volume.GetMTime()
+        return self._smoothed
+
+    def invalidate_smoothing_cache(self):
+        """ drop the cached smoothed, downsampled and quantized volumes (called when a new volume is loaded).
+        """
+        self._smoothed = None
+        self._smoothed_src_mtime = None
+        self._low_res = None
+        self._low_res_src = None
+        self._quantized = None
+        self._quantized_src = None
+
+    def downsample_volume(self, volume):
         """
-        gaussian_smooth = vtk.vtkImageGaussianSmooth()
-        gaussian_smooth.SetInputData(volume)
-        gaussian_smooth.SetStandardDeviation(1.0)
-        gaussian_smooth.Update()
-        return gaussian_smooth.GetOutput()
+            Downsample a 3D volume by a factor of 2 along each axis using VTK.
+
+            The low resolution volume has 8 times fewer cells, which makes it cheap enough
+            to contour while the iso-value slider is being dragged. The result is cached
+            for the given input volume.
+        """
+        if self._low_res is not None and volume is self._low_res_src:
+            return self._low_res
+
+        resample = vtkImageResample()
+        resample.SetInputData(volume)
+        resample.SetMagnificationFactors(0.5, 0.5, 0.5)
+        resample.Update()
+        self._low_res = resample.GetOutput()
+        self._low_res_src = volume
+        return self._low_res
+
+    @staticmethod
+    def uint8_shift_scale(low, high):
+        """ the (shift, scale) pair mapping the intensity window [low, high] onto 0-255.
+        """
+        return -low, (255.0 / (high - low) if high > low else 1.0)
+
+    def quantize_volume(self, volume):
+        """
+            Window a 3D volume to unsigned char (0-255) using VTK.
+
+            vtkDICOMImageReader does not expose the window/level of the series, so the
+            scalar range of the volume is used as the window. The 8-bit volume halves the
+            size of the 3D texture uploaded to the GPU compared to the 16-bit DICOM data.
+            The result is cached for the given input volume.
+        """
+        if self._quantized is not None and volume is self._quantized_src:
+            return self._quantized
+
+        shift, scale = self.uint8_shift_scale(*volume.GetScalarRange())
+        shift_scale = vtkImageShiftScale()
+        shift_scale.SetInputData(volume)
+        shift_scale.SetShift(shift)
+        shift_scale.SetScale(scale)
+        shift_scale.SetOutputScalarTypeToUnsignedChar()
+        shift_scale.ClampOverflowOn()
+        shift_scale.Update()
+        self._quantized = shift_scale.GetOutput()
+        self._quantized_src = volume
+        return self._quantized
+
+    def contour_input(self, volume):
+        """ the smoothed volume to be contoured, at a lower resolution while the slider is held down.
+        """
+        smoothed_volume = self.apply_gaussian_smoothing(volume)
+        if self.main_window.ui.IsoValueSlider.isSliderDown():
+            return self.downsample_volume(smoothed_volume)
+        return smoothed_volume
 
     def create_volume_actor(self, mapper, volume_property):
         """   
@@ -74,32 +274,28 @@ class VolumeRenderer:
             volume property. The resulting actor can be added to a VTK renderer for
             visualization.
         """
-        volume_actor = vtk.vtkVolume()
+        volume_actor = vtkVolume()
         volume_actor.SetMapper(mapper)
         volume_actor.SetProperty(volume_property)
         return volume_actor
 
-    def add_reference_axes(self):
+    def create_reference_axes(self):
         """
-            Add reference axes (cube axes) to the current VTK renderer.
+            Create the reference axes (cube axes) actor.
 
-            This function adds a cube axes actor to the VTK renderer. The cube axes provide
-            reference axes aligned with the coordinate system of the rendered scene. It helps
-            in understanding the orientation and scale of the rendered volume.
+            The cube axes provide reference axes aligned with the coordinate system of the
+            rendered scene. It helps in understanding the orientation and scale of the
+            rendered volume. The actor follows the renderer camera, so it only needs its
+            bounds updated between renders.
         """
-        cube_axes = vtk.vtkCubeAxesActor2D()  # actor
-
-        # Get bounds from the vtkRenderWindow
-        bounds = self.render_window.GetRenderers(
-        ).GetFirstRenderer().ComputeVisiblePropBounds()
-        cube_axes.SetBounds(bounds)
+        cube_axes = vtkCubeAxesActor2D()  # actor
 
-        cube_axes.SetCamera(self.renderer.GetActiveCamera())
+        cube_axes.SetCamera(self.camera)
         cube_axes.SetLabelFormat("%6.4g")  # g --> most compact representation
         cube_axes.SetFlyModeToOuterEdges()
 
         # Create a vtkTextProperty for the cube axes labels
-        text_property = vtk.vtkTextProperty()  # actor
+        text_property = vtkTextProperty()  # actor
         text_property.BoldOn()
         text_property.ItalicOn()
         text_property.ShadowOn()
@@ -110,65 +306,103 @@ class VolumeRenderer:
 
         # Set the line width for the entire axis text
         cube_axes.GetAxisLabelTextProperty().SetFrameWidth(2)
-        cube_axes.GetAxisLabelTextProperty().SetFrameWidth(2)
-        cube_axes.GetAxisLabelTextProperty().SetFrameWidth(2)
 
-        # Add the cube axes to the renderer
-        self.renderer.AddViewProp(cube_axes)
+        return cube_axes
 
-    def ray_casting_rendering(self, volume):
+    def add_reference_axes(self):
+        """
+            Add the reference axes (cube axes) to the current VTK renderer, fitted to the
+            bounds of the visible props.
+        """
+        self._cube_axes.SetBounds(self.renderer.ComputeVisiblePropBounds())
+        self.renderer.AddViewProp(self._cube_axes)
 
-        ray_cast_mapper = vtk.vtkGPUVolumeRayCastMapper()
-        ray_cast_mapper.SetInputData(volume)
-        ray_cast_mapper.SetBlendModeToComposite()
+    def create_volume_property(self):
+        """
+            Create the VTK volume property used for ray casting.
 
-        volume_property = vtk.vtkVolumeProperty()
+            The (still empty) color and opacity transfer functions are built here and pinned
+            to the property, which is created once so the GPU mapper does not have to rebuild
+            its transfer-function textures on every render. Their control points are set by
+            populate_transfer_functions.
+        """
+        volume_property = vtkVolumeProperty()
         volume_property.SetIndependentComponents(1)
         volume_property.ShadeOn()
 
-        # Create a color transfer function
-        color_transfer_function = vtk.vtkColorTransferFunction()
+        # Set the color transfer function in the volume property
+        volume_property.SetColor(vtkColorTransferFunction())
 
-        # Add control points to the color transfer function
-        color_transfer_function.AddRGBPoint(0, 0.0, 0.0, 0.0)
-        color_transfer_function.AddRGBPoint(200, 1.0, 1.0, 1.0)
+        # Set the opacity transfer function in the volume property
+        volume_property.SetScalarOpacity(vtkPiecewiseFunction())
 
-        # Set the color transfer function in the volume property
-        volume_property.SetColor(color_transfer_function)
+        return volume_property
 
-        # Create an opacity transfer function
-        opacity_transfer_function = vtk.vtkPiecewiseFunction()
+    def populate_transfer_functions(self, low, high):
+        """
+            Set the control points of the ray casting transfer functions.
+
+            The points are given in raw intensities (COLOR_POINTS, OPACITY_POINTS) and are
+            converted with the same shift/scale that quantize_volume applies for the window
+            [low, high], so they keep pointing at the same tissue in the 8-bit volume.
+        """
+        shift, scale = self.uint8_shift_scale(low, high)
+
+        # Add control points to the color transfer function
+        self._ctf.RemoveAllPoints()
+        for intensity, (red, green, blue) in self.COLOR_POINTS:
+            self._ctf.AddRGBPoint((intensity + shift) * scale, red, green, blue)
 
         # Add control points to the opacity transfer function
-        opacity_transfer_function.AddPoint(0, 0.0)
-        opacity_transfer_function.AddPoint(80, 0.1)
-        opacity_transfer_function.AddPoint(120, 0.8)
-        opacity_transfer_function.AddPoint(255, 1.0)
+        self._otf.RemoveAllPoints()
+        for intensity, opacity in self.OPACITY_POINTS:
+            self._otf.AddPoint((intensity + shift) * scale, opacity)
 
-        # Set the opacity transfer function in the volume property
-        volume_property.SetScalarOpacity(opacity_transfer_function)
+    def ray_casting_rendering(self, volume):
 
-        # apply filter
-        smoothed_volume = self.apply_gaussian_smoothing(volume)
+        if self._ray_mapper is None:
+            ray_cast_mapper = vtkGPUVolumeRayCastMapper()
+            ray_cast_mapper.SetBlendModeToComposite()
+            # the sample distance is left to AutoAdjustSampleDistances (on by default), which
+            # derives it from the voxel spacing and the interactor's update rates
 
-        ray_cast_mapper.SetInputData(smoothed_volume)  # reset input data
+            # Jittering is a technique often used in computer graphics to reduce aliasing artifacts
+            ray_cast_mapper.SetUseJittering(True)
+            # keep shading local (VTK >= 9.2) so front-to-back compositing can terminate rays early
+            if hasattr(ray_cast_mapper, "SetGlobalIlluminationReach"):
+                ray_cast_mapper.SetGlobalIlluminationReach(0.0)
 
-        volume_actor = self.create_volume_actor(
-            ray_cast_mapper, volume_property)
+            self._ray_mapper = ray_cast_mapper
+            self._ray_actor = self.create_volume_actor(
+                ray_cast_mapper, self._vol_prop)
 
-        self.renderer.AddVolume(volume_actor)
+        ray_cast_mapper = self._ray_mapper
+        # the transfer functions were moved into the quantized 0-255 range by load_volume
+        ray_cast_mapper.SetInputData(self.quantize_volume(volume))
 
-        self.renderer.SetBackground(0, 0, 0)
-        volume_property.ShadeOn()
-        # Jittering is a technique often used in computer graphics to reduce aliasing artifacts
-        ray_cast_mapper.SetUseJittering(True)
-        ray_cast_mapper.SetSampleDistance(0.001)
+        self.renderer.AddVolume(self._ray_actor)
 
-        self.renderer.ResetCamera()
+        self.renderer.SetBackground(0, 0, 0)
         self.add_reference_axes()
 
     def update_visualization(self):
         if self.volume:
+            volume = self.volume.GetOutput()
+            mode = self.main_window.rendering_mode
+
+            if volume is self._rendered_volume and mode == self._rendered_mode:
+                # same volume and mode: only the iso-value can have changed, so update
+                # the existing contour in place instead of rebuilding the scene
+                if mode == 0:
+                    self._contour.SetInputData(self.contour_input(volume))
+                    self._contour.GenerateValues(
+                        5, self.iso_value, self.scalar_min)
+                    # the new surface may have different extents
+                    self._cube_axes.SetBounds(
+                        self.renderer.ComputeVisiblePropBounds())
+                self.render_window.Render()
+                return
+
             # retain the current camera position, focal point and zooming to rerendering
             current_position = self.camera.GetPosition()
             current_focal_point = self.camera.GetFocalPoint()
@@ -178,64 +412,92 @@ class VolumeRenderer:
             self.renderer.RemoveAllViewProps()
 
             # Check the rendering mode and update the visualization accordingly
-            if self.main_window.rendering_mode == 0:
+            if mode == 0:
                 # Surface Rendering
-                self.surface_rendering(self.volume.GetOutput(), self.iso_value)
-            elif self.main_window.rendering_mode == 1:
+                self.surface_rendering(volume, self.iso_value)
+            elif mode == 1:
                 # Ray Casting Rendering
-                self.ray_casting_rendering(self.volume.GetOutput())
+                self.ray_casting_rendering(volume)
 
-            # reset the camera position, focal point and zooming
-            self.camera.SetPosition(current_position)
-            self.camera.SetFocalPoint(current_focal_point)
-            self.camera.SetDistance(current_zoom)
+            self._rendered_volume = volume
+            self._rendered_mode = mode
+
+            if self._needs_reset:
+                # first render of a new volume: fit the camera to it
+                self.renderer.ResetCamera()
+                self._needs_reset = False
+            else:
+                # reset the camera position, focal point and zooming
+                self.camera.SetPosition(current_position)
+                self.camera.SetFocalPoint(current_focal_point)
+                self.camera.SetDistance(current_zoom)
 
             self.render_window.Render()
 
     def handle_iso_value(self):
         self.iso_value = self.main_window.ui.IsoValueSlider.value()
         self.main_window.ui.IsoValue.setText(f"Iso Value: {self.iso_value}")
+        # (re)start the debounce timer, the latest iso value is rendered once it fires
+        self._iso_timer.start(80)
+
+    def handle_slider_released(self):
+        # the drag preview used the low resolution volume, render once more at full resolution
+        self._iso_timer.stop()
         self.update_visualization()
 
     def set_iso_sliders(self):
         """ initializing the slider values and set the current value to the middle of the slider.
         """
-        self.main_window.ui.IsoValueSlider.setMaximum(
-            self.intensity_values[-1])
-        self.main_window.ui.IsoValueSlider.setMinimum(
-            self.intensity_values[0])
+        self.main_window.ui.IsoValueSlider.setMaximum(self.scalar_max)
+        self.main_window.ui.IsoValueSlider.setMinimum(self.scalar_min)
         self.main_window.ui.IsoValueSlider.setValue(
-            self.intensity_values[len(self.intensity_values)//2])
+            (self.scalar_min + self.scalar_max) // 2)
 
     def calculate_contour_number(self, iso_value):
         # Determine the number of contours based on the iso-value and intensity range
-        num_contours = len(
-            [value for value in self.intensity_values if value <= iso_value])
-        return num_contours
+        # (every integer intensity from the scalar minimum up to the iso-value)
+        return max(0, iso_value - self.scalar_min + 1)
 
     def surface_rendering(self, volume, iso_value):
         # apply gaussian filter, helps to reduce noise and artifacts in the data,
         # leading to a smoother and more visually appealing surface when rendering.
-        smoothed_volume = self.apply_gaussian_smoothing(volume)
-
-        # Contour extraction is a technique where surfaces are defined based on specific scalar values (iso-value) in the volume data
-        contour_filter = vtk.vtkContourFilter()
-        contour_filter.SetInputData(smoothed_volume)
+        smoothed_volume = self.contour_input(volume)
+
+        if self._contour is None:
+            # Contour extraction is a technique where surfaces are defined based on specific scalar values (iso-value) in the volume data
+            # vtkFlyingEdges3D is a multi-threaded drop-in replacement for vtkContourFilter on image data
+            contour_filter = vtkFlyingEdges3D()
+            # skip the per-vertex normal/gradient/scalar passes over the volume,
+            # the OpenGL mapper falls back to face normals computed on the GPU
+            contour_filter.ComputeNormalsOff()
+            contour_filter.ComputeGradientsOff()
+            contour_filter.ComputeScalarsOff()
+
+            mapper = vtkPolyDataMapper()
+            mapper.SetInputConnection(contour_filter.GetOutputPort())
+            # the contour carries no scalars, colour the surface through the actor instead
+            mapper.ScalarVisibilityOff()
+
+            actor = vtkActor()
+            actor.SetMapper(mapper)
+            actor.SetPosition(0, 0, 0)
+            # blue, as the scalar-coloured surfaces were (iso-values above the mapper's default
+            # 0-1 scalar range all mapped to the top colour of the default lookup table)
+            actor.GetProperty().SetColor(0.0, 0.0, 1.0)
+
+            self._contour = contour_filter
+            self._surf_mapper = mapper
+            self._surf_actor = actor
+
+        self._contour.SetInputData(smoothed_volume)
         # (number of contours, maximum contour value , minimum contour value)
 
         # can't control the number of contours as it case a crash
-        contour_filter.GenerateValues(
-            5, iso_value, self.intensity_values[0])
-        mapper = vtk.vtkPolyDataMapper()
-        mapper.SetInputConnection(contour_filter.GetOutputPort())
-
-        actor = vtk.vtkActor()
-        actor.SetMapper(mapper)
-        actor.SetPosition(0, 0, 0)
+        self._contour.GenerateValues(
+            5, iso_value, self.scalar_min)
 
-        self.renderer.AddActor(actor)
+        self.renderer.AddActor(self._surf_actor)
 
         self.renderer.SetBackground(0, 0, 0)
-        self.renderer.ResetCamera()
         self.add_reference_axes()
         self.visualize_flag = 1
@@ -1,13 +1,47 @@
 import sys
-from PyQt5.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QFileDialog, QWidget, QMessageBox
+from PyQt5.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QFileDialog, QMessageBox
 from PyQt5.QtGui import QIcon
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt5.uic import loadUi
-import vtk
+from vtkmodules.vtkIOImage import vtkDICOMImageReader
+import vtkmodules.vtkInteractionStyle  # default interactor style for the render window
 import os
-from vtk.qt.QVTKRenderWindowInteractor import QVTKRenderWindowInteractor
+from vtkmodules.qt.QVTKRenderWindowInteractor import QVTKRenderWindowInteractor
 from VolumeRenderer import VolumeRenderer
 
 
+class DicomLoaderSignals(QObject):
+    # emitted with the updated vtkDICOMImageReader once the series is read (None if reading failed)
+    loaded = pyqtSignal(object)
+
+
+class DicomLoader(QRunnable):
+    """
+    Read a DICOM series on a worker thread so the UI stays responsive.
+
+    QRunnable is not a QObject, so the completion signal lives on a separate
+    DicomLoaderSignals instance (created on the GUI thread, so connected slots run there).
+    """
+
+    def __init__(self, directory):
+        super().__init__()
+        self.directory = directory
+        self.signals = DicomLoaderSignals()
+
+    def run(self):
+        # always emit, otherwise the import and clear buttons would stay disabled
+        try:
+            reader = vtkDICOMImageReader()
+            reader.SetDirectoryName(self.directory)
+            reader.Update()
+            # read errors are only reported on VTK's error output and leave an empty image
+            if reader.GetOutput().GetNumberOfPoints() == 0:
+                reader = None
+        except Exception:
+            reader = None
+        self.signals.loaded.emit(reader)
+
+
 class VTKMainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -19,18 +53,20 @@ class VTKMainWindow(QMainWindow):
         self.resize(1200, 800)
         # either (0--> surface rendering, 1--> ray-casting rendering)
         self.rendering_mode = None
+        # the most recent DICOM loader submitted to the thread pool
+        self.dicom_loader = None
 
+        self.vtk_widget = self.create_vtk_widget()  # create a custom VTK widget
         # put the QOpenGLWidget in a vertical layout
         layout = QVBoxLayout(self.ui.render_area)
-        self.vtk_widget = self.create_vtk_widget()  # create a custom VTK widget
-        # add this widget to the vertical layout
         layout.addWidget(self.vtk_widget)
 
+        self.volume_renderer = VolumeRenderer(self.vtk_widget, self)
+
+        # connect the buttons only once everything they use exists
         self.ui.Import_button.clicked.connect(self.browse)
         self.ui.clear_button.clicked.connect(self.clear_output)
 
-        self.volume_renderer = VolumeRenderer(self.vtk_widget, self)
-
         self.ui.IsoValue.setText(
             # displaying the initial value of the iso Value (0)
             f"Iso Value: {self.volume_renderer.iso_value}")
@@ -69,23 +105,27 @@ class VTKMainWindow(QMainWindow):
         else:
             if self.volume_renderer.visualize_flag:  # there is an existing visualization
                 self.clear_output()
-            dicom_reader = self.load_dicom_series(
-                folder_path)  # A VTK DICOM image reader
-
-            if dicom_reader:
-                self.volume_renderer.volume = dicom_reader  # the volume to be rendered
-                # compute all the possible iso-values that exists in the render
-                self.volume_renderer.compute_intensity_values()
-
-                if self.rendering_mode == 0:
-                    # Surface Rendering
-                    iso_value = self.volume_renderer.iso_value
-                    self.volume_renderer.surface_rendering(
-                        dicom_reader.GetOutput(), iso_value)
-                elif self.rendering_mode == 1:
-                    # Ray Casting Rendering
-                    self.volume_renderer.ray_casting_rendering(
-                        dicom_reader.GetOutput())
+            # the series is read in the background, handle_dicom_loaded takes over once it is done
+            self.load_dicom_series(folder_path)
+
+    def handle_dicom_loaded(self, dicom_reader):
+        """
+        Render the DICOM series once the background loader has read it.
+
+        Parameters:
+            dicom_reader (vtkDICOMImageReader): The reader holding the loaded series,
+            or None if the series could not be read.
+        """
+        self.ui.Import_button.setEnabled(True)
+        self.ui.clear_button.setEnabled(True)
+
+        if dicom_reader is None:
+            self.show_error_message("Failed to read the DICOM series")
+            return
+
+        self.volume_renderer.load_volume(dicom_reader)  # the volume to be rendered
+        # render it in the current mode, fitting the camera to the new volume
+        self.volume_renderer.update_visualization()
 
     def show_error_message(self, message):
         """
@@ -107,17 +147,20 @@ class VTKMainWindow(QMainWindow):
         """
         Load a DICOM series from the specified directory using VTK.
 
+        The series is read by a DicomLoader in the global thread pool. The import and
+        clear buttons are disabled until the loader hands the vtkDICOMImageReader
+        back to handle_dicom_loaded.
+
         Parameters:
             directory (str): The path to the directory containing the DICOM series.
-
-        Returns:
-            vtk.vtkDICOMImageReader: A VTK DICOM image reader instance containing the
-            loaded DICOM series.
         """
-        reader = vtk.vtkDICOMImageReader()
-        reader.SetDirectoryName(directory)
-        reader.Update()
-        return reader
+        self.ui.Import_button.setEnabled(False)
+        self.ui.clear_button.setEnabled(False)
+
+        # keep a reference so the loader (and its signals object) outlives this call
+        self.dicom_loader = DicomLoader(directory)
+        self.dicom_loader.signals.loaded.connect(self.handle_dicom_loaded)
+        QThreadPool.globalInstance().start(self.dicom_loader)
 
     def has_dicom_files(self, directory):
         """
@@ -131,9 +174,9 @@ class VTKMainWindow(QMainWindow):
 
         """
         if directory:
-            dicom_files = [file for file in os.listdir(
-                directory) if file.lower().endswith('.dcm')]
-            return bool(dicom_files)
+            # stop at the first DICOM file instead of listing the whole directory
+            with os.scandir(directory) as entries:
+                return any(entry.name.lower().endswith('.dcm') for entry in entries if entry.is_file())
         else:
             self.show_error_message(
                 "DICOM files not found")
@@ -158,8 +201,8 @@ class VTKMainWindow(QMainWindow):
         self.volume_renderer.update_visualization()
 
     def clear_output(self):
-        # overwrite the existing VolumeRenderer object
-        self.volume_renderer = VolumeRenderer(self.vtk_widget, self)
+        # reset the existing VolumeRenderer in place (a new one would leak its slider connections)
+        self.volume_renderer.reset()
         self.ui.IsoValueSlider.setValue(0)  # reset the slider value
         # rendering the render window (refresh after clearing)
         self.volume_renderer.render_window.Render()